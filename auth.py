@@ -24,8 +24,6 @@ import logging
 
 load_dotenv()
 
-# Setup logging
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/auth", tags=["auth"])
@@ -48,7 +46,7 @@ conf = ConnectionConfig(
 
 @router.post("/register/customer", status_code=status.HTTP_201_CREATED)
 async def register_customer(db: db_dependency, create_user_request: CreateUserRequest):
-    logger.info(f"Customer registration payload: {create_user_request}")
+    logger.info("Customer registration payload: %s", create_user_request)
     existing_user = db.query(Users).filter(
         (Users.email == create_user_request.email) | (Users.username == create_user_request.username)
     ).first()
@@ -64,12 +62,12 @@ async def register_customer(db: db_dependency, create_user_request: CreateUserRe
     db.add(create_user_model)
     db.commit()
     db.refresh(create_user_model)
-    logger.info(f"Customer {create_user_request.username} registered successfully")
+    logger.info("Customer %s registered successfully", create_user_request.username)
     return {"message": "Customer created successfully"}
 
 @router.post("/register/admin", status_code=status.HTTP_201_CREATED)
 async def register_admin(db: db_dependency, create_user_request: CreateUserRequest):
-    logger.info(f"Admin registration payload: {create_user_request}")
+    logger.info("Admin registration payload: %s", create_user_request)
     existing_user = db.query(Users).filter(
         (Users.email == create_user_request.email) | (Users.username == create_user_request.username)
     ).first()
@@ -85,7 +83,7 @@ async def register_admin(db: db_dependency, create_user_request: CreateUserReque
     db.add(create_user_model)
     db.commit()
     db.refresh(create_user_model)
-    logger.info(f"Admin {create_user_request.username} registered successfully")
+    logger.info("Admin %s registered successfully", create_user_request.username)
     return {"message": "Admin created successfully"}
 
 
@@ -105,10 +103,10 @@ def create_access_token(username: str, user_id: int, role: str, expires_delta: t
 
 @router.post("/login", response_model=Token)
 async def login(form_data: LoginUserRequest, db: db_dependency):
-    logger.info(f"Login attempt for email: {form_data.email}")
+    logger.info("Login attempt for email: %s", form_data.email)
     user = authenticate_user(form_data.email, form_data.password, db)
     token = create_access_token(user.username, user.id, user.role.value, timedelta(hours=1))
-    logger.info(f"User {user.username} logged in successfully")
+    logger.info("User %s logged in successfully", user.username)
     return {"access_token": token, "token_type": "bearer"}
 
 async def get_active_user(token: Annotated[str, Depends(oauth2_bearer)]):
@@ -137,7 +135,7 @@ async def verify_token(request_body: TokenVerifyRequest):
         if exp_datetime < datetime.utcnow():
             logger.warning("Token expired during verification")
             raise HTTPException(status_code=401, detail="Token expired")
-        logger.info(f"Token verified for user: {username}")
+        logger.info("Token verified for user: %s", username)
         return {"username": username, "tokenverification": "success"}
     except jwt.DecodeError:
         logger.warning("Invalid token during verification")
@@ -148,7 +146,7 @@ async def forgot_password(forgot_password_request: ForgotPasswordRequest, db: db
     email = forgot_password_request.email
     user = db.query(Users).filter(Users.email == email).first()
     if not user:
-        logger.warning(f"Password reset requested for non-existent email: {email}")
+        logger.warning("Password reset requested for non-existent email: %s", email)
         raise HTTPException(status_code=404, detail="User does not exist")
     
     token_expires = timedelta(hours=1)
@@ -163,7 +161,7 @@ async def forgot_password(forgot_password_request: ForgotPasswordRequest, db: db
     )
     fm = FastMail(conf)
     await fm.send_message(message)
-    logger.info(f"Password reset email sent to: {email}")
+    logger.info("Password reset email sent to: %s", email)
     return {"message": "Password reset email sent"}
     
 
@@ -178,14 +176,14 @@ async def reset_password(token: str, reset_password_request: ResetPasswordReques
         
         user = db.query(Users).filter(Users.id == user_id).first()
         if not user:
-            logger.warning(f"Password reset attempted for non-existent user ID: {user_id}")
+            logger.warning("Password reset attempted for non-existent user ID: %s", user_id)
             raise HTTPException(status_code=404, detail="User does not exist")
         
         user.hashed_password = bcrypt_context.hash(reset_password_request.new_password)
         db.add(user)
         db.commit()
         db.refresh(user)
-        logger.info(f"Password reset successfully for user: {user.username}")
+        logger.info("Password reset successfully for user: %s", user.username)
         return {"message": "Password has been reset successfully"}
     except jwt.ExpiredSignatureError:
         logger.warning("Expired reset token")
@@ -0,0 +1,73 @@
+import os
+import logging
+from typing import Any, Optional
+
+from redis import asyncio as aioredis
+from redis.exceptions import RedisError
+from dotenv import load_dotenv
+
+load_dotenv()
+
+logger = logging.getLogger(__name__)
+
+REDIS_URL = os.getenv("REDIS_URL", "redis://localhost:6379/0")
+PREFIX = "api"
+
+# Connections are opened lazily on first use and closed by the application lifespan in main.py
+redis_client = aioredis.from_url(REDIS_URL)
+
+
+def key(namespace: str, *parts: Any) -> str:
+    """Build a cache key inside a namespace, e.g. api:products:browse:shoes:1:10"""
+    return ":".join([PREFIX, namespace, *(str(part) for part in parts)])
+
+
+async def versioned_key(namespace: str, *parts: Any) -> Optional[str]:
+    """
+    Build a key that embeds the namespace's current epoch, e.g. api:products:7:browse:shoes:1:10,
+    so clear() can retire every entry at once. None when Redis is unavailable
+    """
+    try:
+        epoch = await redis_client.get(key(namespace, "epoch"))
+    except RedisError as e:
+        logger.warning("Cache epoch read failed for %s: %s", namespace, e)
+        return None
+    return key(namespace, int(epoch or 0), *parts)
+
+
+async def get(cache_key: Optional[str]) -> Optional[bytes]:
+    """Return the cached bytes for a key, or None on a miss or when Redis is unavailable"""
+    if cache_key is None:
+        return None
+    try:
+        return await redis_client.get(cache_key)
+    except RedisError as e:
+        logger.warning("Cache read failed for %s: %s", cache_key, e)
+        return None
+
+
+async def set(cache_key: Optional[str], value: bytes, expire: int, nx: bool = False) -> None:
+    """Store bytes under a key for `expire` seconds; with nx, only if the key is not already set"""
+    if cache_key is None:
+        return
+    try:
+        await redis_client.set(cache_key, value, ex=expire, nx=nx)
+    except RedisError as e:
+        logger.warning("Cache write failed for %s: %s", cache_key, e)
+
+
+async def clear(namespace: str) -> None:
+    """Retire every versioned entry in a namespace by bumping its epoch"""
+    try:
+        await redis_client.incr(key(namespace, "epoch"))
+    except RedisError as e:
+        # Entries still expire on their own TTL, so a failed clear only serves stale data briefly
+        logger.warning("Cache clear failed for namespace %s: %s", namespace, e)
+
+
+async def delete(cache_key: str) -> None:
+    """Drop a single key so its next reader rebuilds it"""
+    try:
+        await redis_client.unlink(cache_key)
+    except RedisError as e:
+        logger.warning("Cache delete failed for %s: %s", cache_key, e)
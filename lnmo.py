@@ -1,21 +1,22 @@
 import os
-import requests
+import asyncio
+import httpx
 import base64
+import time
 from datetime import datetime
 from decimal import Decimal
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional, Tuple
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, BackgroundTasks, Body, Depends, HTTPException, Query, status
 from pydantic_models import TransactionRequest, QueryRequest, APIResponse, CallbackRequest , CheckTransactionStatus
-from database import db_dependency
-from sqlalchemy.orm import Session
+from database import db_dependency, SessionLocal
+from sqlalchemy.orm import Session, load_only
 from sqlalchemy import select
 import models
+from fastapi.concurrency import run_in_threadpool
 from auth import get_active_user
 import logging
 
-# Setup logging
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 # Create router
@@ -48,97 +49,157 @@ class LNMORepository:
             if not getattr(self, var):
                 raise ValueError(f"Missing required environment variable: {var}")
 
-    async def transact(self, data: Dict[str, Any], db: Session, user_id: int) -> Dict[str, Any]:
+        self.base_url = f"https://{self.MPESA_LNMO_ENVIRONMENT}.safaricom.co.ke"
+        # Shared keep-alive client, opened and closed by the application lifespan in main.py
+        self.client: Optional[httpx.AsyncClient] = None
+
+        # The consumer credentials are fixed for the process lifetime, so encode them once
+        credentials = f"{self.MPESA_LNMO_CONSUMER_KEY}:{self.MPESA_LNMO_CONSUMER_SECRET}"
+        self._basic_auth_header = "Basic " + base64.b64encode(credentials.encode()).decode()
+
+        # Only the timestamp part of the STK password changes between requests
+        self._pw_prefix = f"{self.MPESA_LNMO_SHORT_CODE}{self.MPESA_LNMO_PASS_KEY}".encode()
+
+        # STK push fields that are the same for every request
+        self._stk_template = {
+            "BusinessShortCode": self.MPESA_LNMO_SHORT_CODE,
+            "TransactionType": "CustomerPayBillOnline",
+            "PartyB": self.MPESA_LNMO_SHORT_CODE,
+            "CallBackURL": self.MPESA_LNMO_CALLBACK_URL,
+        }
+
+        # OAuth token cache, shared process-wide through the module-level repository
+        self._token: Optional[str] = None
+        self._token_expiry: float = 0.0
+        self._token_lock = asyncio.Lock()
+
+    async def transact(
+        self, data: Dict[str, Any], db: Session, user_id: int, access_token: Optional[str] = None
+    ) -> Dict[str, Any]:
         """Handle MPESA LNMO transaction"""
         try:
-            endpoint = f"https://{self.MPESA_LNMO_ENVIRONMENT}.safaricom.co.ke/mpesa/stkpush/v1/processrequest"
+            endpoint = "/mpesa/stkpush/v1/processrequest"
             headers = {
-                "Authorization": "Bearer " + self.generate_access_token(),
-                "Content-Type": "application/json",
+                "Authorization": "Bearer " + (access_token or await self.generate_access_token()),
             }
             
-            timestamp = datetime.now().strftime("%Y%m%d%H%M%S")
-            payload = {
-                "BusinessShortCode": self.MPESA_LNMO_SHORT_CODE,
-                "Password": self.generate_password(),
-                "Timestamp": timestamp,
-                "TransactionType": "CustomerPayBillOnline",
-                "Amount": str(data["amount"]),
-                "PartyA": data["phone_number"],
-                "PartyB": self.MPESA_LNMO_SHORT_CODE,
-                "PhoneNumber": data["phone_number"],
-                "CallBackURL": self.MPESA_LNMO_CALLBACK_URL,
-                "AccountReference": str(data["order_id"]),
-                "TransactionDesc": f"Payment for order {data['order_id']}",
-            }
+            timestamp = time.strftime("%Y%m%d%H%M%S", time.localtime())
+            payload = self._stk_payload(data, self.generate_password(timestamp), timestamp)
 
-            response = requests.post(endpoint, json=payload, headers=headers)
+            response = await self.client.post(endpoint, json=payload, headers=headers)
             response_data = response.json()
 
             # Save transaction to the database
-            transaction = models.Transaction(
-                _pid=data["order_id"],
-                party_a=data["phone_number"],
-                party_b=self.MPESA_LNMO_SHORT_CODE,
-                account_reference=str(data["order_id"]),
-                transaction_category=0,  # PURCHASE_ORDER
-                transaction_type=1,      # CREDIT
-                transaction_channel=1,   # LNMO
-                transaction_aggregator=0, # MPESA_KE
-                transaction_id=response_data.get("CheckoutRequestID"),
-                transaction_amount=Decimal(str(data["amount"])),
-                transaction_code=None,
-                transaction_timestamp=datetime.now(),
-                transaction_details=f"Payment for order {data['order_id']}",
-                _feedback=response_data,
-                _status=models.TransactionStatus.PROCESSING,
-                user_id=user_id,
-                # order_id=None  # Will be linked when order is created
-            )
+            transaction = self._transaction_record(data, response_data, user_id)
 
             db.add(transaction)
             db.commit()
             db.refresh(transaction)
 
-            logger.info(f"Transaction created: ID {transaction.id} for user {user_id}")
+            logger.info("Transaction created: ID %s for user %s", transaction.id, user_id)
             return response_data
 
         except Exception as e:
-            logger.error(f"Error in transact: {str(e)}")
+            logger.error("Error in transact: %s", e)
             db.rollback()
             raise HTTPException(
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
                 detail=f"Transaction failed: {str(e)}"
             )
 
-    def query(self, transaction_id: str) -> Dict[str, Any]:
+    def _transaction_record(
+        self, data: Dict[str, Any], response_data: Dict[str, Any], user_id: int
+    ) -> models.Transaction:
+        """Build the Transaction row for an STK push Safaricom has responded to"""
+        return models.Transaction(
+            _pid=data["order_id"],
+            party_a=data["phone_number"],
+            party_b=self.MPESA_LNMO_SHORT_CODE,
+            account_reference=str(data["order_id"]),
+            transaction_category=0,  # PURCHASE_ORDER
+            transaction_type=1,      # CREDIT
+            transaction_channel=1,   # LNMO
+            transaction_aggregator=0, # MPESA_KE
+            transaction_id=response_data.get("CheckoutRequestID"),
+            transaction_amount=Decimal(str(data["amount"])),
+            transaction_code=None,
+            transaction_timestamp=datetime.now(),
+            transaction_details=f"Payment for order {data['order_id']}",
+            _feedback=response_data,
+            _status=models.TransactionStatus.PROCESSING,
+            user_id=user_id,
+            # order_id=None  # Will be linked when order is created
+        )
+
+    def _stk_payload(self, data: Dict[str, Any], password: str, timestamp: str) -> Dict[str, Any]:
+        """Build the STK push payload for a single payment"""
+        return {
+            **self._stk_template,
+            "Password": password,
+            "Timestamp": timestamp,
+            "Amount": str(data["amount"]),
+            "PartyA": data["phone_number"],
+            "PhoneNumber": data["phone_number"],
+            "AccountReference": str(data["order_id"]),
+            "TransactionDesc": f"Payment for order {data['order_id']}",
+        }
+
+    def build_stk_payloads(self, items: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Build STK push payloads for a batch, sharing one timestamp and password"""
+        timestamp = time.strftime("%Y%m%d%H%M%S", time.localtime())
+        password = self.generate_password(timestamp)
+        return [self._stk_payload(data, password, timestamp) for data in items]
+
+    async def push_many(
+        self, items: List[Dict[str, Any]], access_token: Optional[str] = None
+    ) -> Tuple[List[Dict[str, Any]], List[Any]]:
+        """Send STK pushes for a batch concurrently.
+
+        Returns the payloads and, in the same order, either the httpx response
+        or the exception raised for each push.
+        """
+        # Build the batch off the event loop so it keeps serving callbacks meanwhile
+        loop = asyncio.get_running_loop()
+        payloads = await loop.run_in_executor(None, self.build_stk_payloads, items)
+
+        headers = {
+            "Authorization": "Bearer " + (access_token or await self.generate_access_token()),
+        }
+        responses = await asyncio.gather(
+            *(self.client.post("/mpesa/stkpush/v1/processrequest", json=payload, headers=headers)
+              for payload in payloads),
+            return_exceptions=True
+        )
+        return payloads, responses
+
+    async def query(self, transaction_id: str) -> Dict[str, Any]:
         """Query MPESA LNMO transaction status"""
         try:
-            endpoint = f"https://{self.MPESA_LNMO_ENVIRONMENT}.safaricom.co.ke/mpesa/stkpushquery/v1/query"
+            endpoint = "/mpesa/stkpushquery/v1/query"
             headers = {
-                "Authorization": "Bearer " + self.generate_access_token(),
-                "Content-Type": "application/json",
+                "Authorization": "Bearer " + await self.generate_access_token(),
             }
             
+            timestamp = time.strftime("%Y%m%d%H%M%S", time.localtime())
             payload = {
                 "BusinessShortCode": self.MPESA_LNMO_SHORT_CODE,
-                "Password": self.generate_password(),
-                "Timestamp": datetime.now().strftime("%Y%m%d%H%M%S"),
+                "Password": self.generate_password(timestamp),
+                "Timestamp": timestamp,
                 "CheckoutRequestID": transaction_id,
             }
 
-            response = requests.post(endpoint, json=payload, headers=headers)
+            response = await self.client.post(endpoint, json=payload, headers=headers)
             return response.json()
             
         except Exception as e:
-            logger.error(f"Error in query: {str(e)}")
+            logger.error("Error in query: %s", e)
             raise HTTPException(
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
                 detail=f"Query failed: {str(e)}"
             )
 
-    async def callback(self, data: Dict[str, Any], db: Session) -> Dict[str, Any]:
-        """Handle MPESA callback"""
+    def callback(self, data: Dict[str, Any], db: Session) -> Dict[str, Any]:
+        """Handle MPESA callback (sync, so background tasks run it in the threadpool)"""
         try:
             checkout_request_id = data["body"]["stkCallback"]["checkoutRequestID"]
 
@@ -169,59 +230,66 @@ class LNMORepository:
                     transaction._status = models.TransactionStatus.REJECTED
 
                 db.commit()
-                logger.info(f"Transaction {transaction.id} updated via callback: status {transaction._status}")
+                logger.info("Transaction %s updated via callback: status %s", transaction.id, transaction._status)
             else:
-                logger.warning(f"Transaction not found for checkout_request_id: {checkout_request_id}")
+                logger.warning("Transaction not found for checkout_request_id: %s", checkout_request_id)
 
             return data
 
         except Exception as e:
-            logger.error(f"Error in callback: {str(e)}")
+            logger.error("Error in callback: %s", e)
             db.rollback()
             raise HTTPException(
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
                 detail=f"Callback processing failed: {str(e)}"
             )
 
-    def generate_access_token(self) -> str:
-        """Generate an access token for the MPESA API"""
-        try:
-            endpoint = f"https://{self.MPESA_LNMO_ENVIRONMENT}.safaricom.co.ke/oauth/v1/generate?grant_type=client_credentials"
-            credentials = f"{self.MPESA_LNMO_CONSUMER_KEY}:{self.MPESA_LNMO_CONSUMER_SECRET}"
-            encoded_credentials = base64.b64encode(credentials.encode()).decode()
+    async def generate_access_token(self) -> str:
+        """Return a cached access token for the MPESA API, fetching a new one when expired"""
+        if self._token and time.monotonic() < self._token_expiry:
+            return self._token
 
-            headers = {
-                "Authorization": f"Basic {encoded_credentials}",
-                "Content-Type": "application/json",
-            }
+        async with self._token_lock:
+            # Another request may have refreshed the token while we waited for the lock
+            if self._token and time.monotonic() < self._token_expiry:
+                return self._token
 
-            response = requests.get(endpoint, headers=headers)
-            response_data = response.json()
+            try:
+                endpoint = "/oauth/v1/generate"
+                headers = {
+                    "Authorization": self._basic_auth_header,
+                }
 
-            if response.status_code == 200:
-                return response_data["access_token"]
-            else:
-                raise Exception(
-                    f"Failed to generate access token: {response_data.get('error_description', 'Unknown error')}"
+                response = await self.client.get(
+                    endpoint, params={"grant_type": "client_credentials"}, headers=headers
+                )
+                response_data = response.json()
+
+                if response.status_code == 200:
+                    # Refresh 60s before Safaricom expires the token
+                    expires_in = int(response_data.get("expires_in", 3599))
+                    self._token = response_data["access_token"]
+                    self._token_expiry = time.monotonic() + expires_in - 60
+                    return self._token
+                else:
+                    raise Exception(
+                        f"Failed to generate access token: {response_data.get('error_description', 'Unknown error')}"
+                    )
+
+            except Exception as e:
+                logger.error("Error generating access token: %s", e)
+                raise HTTPException(
+                    status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                    detail="Failed to generate access token"
                 )
 
-        except Exception as e:
-            logger.error(f"Error generating access token: {str(e)}")
-            raise HTTPException(
-                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                detail="Failed to generate access token"
-            )
-
-    def generate_password(self) -> str:
-        """Generate a password for the MPESA API transaction"""
+    def generate_password(self, timestamp: str) -> str:
+        """Generate a password for the MPESA API transaction at the given timestamp"""
         try:
-            timestamp = datetime.now().strftime("%Y%m%d%H%M%S")
-            password = base64.b64encode(
-                f"{self.MPESA_LNMO_SHORT_CODE}{self.MPESA_LNMO_PASS_KEY}{timestamp}".encode()
-            ).decode()
+            password = base64.b64encode(self._pw_prefix + timestamp.encode()).decode()
             return password
         except Exception as e:
-            logger.error(f"Error generating password: {str(e)}")
+            logger.error("Error generating password: %s", e)
             raise HTTPException(
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
                 detail="Failed to generate password"
@@ -242,25 +310,35 @@ async def initiate_payment(
     db: db_dependency
 ):
     """Initiate MPESA LNMO payment for an order"""
-    try:
+    def fetch_order():
         # Verify the order exists and belongs to the user
         order = db.query(models.Orders).filter(
             models.Orders.order_id == transaction_data.order_id,
             models.Orders.user_id == user.get("id")
         ).first()
-        
+
+        # Check if order already has a successful payment
+        existing_transaction = None
+        if order:
+            existing_transaction = db.query(models.Transaction).filter(
+                models.Transaction._pid == transaction_data.order_id,
+                models.Transaction._status == models.TransactionStatus.ACCEPTED
+            ).first()
+        return order, existing_transaction
+
+    try:
+        # The order lookup and the OAuth token fetch are independent, so overlap them
+        (order, existing_transaction), access_token = await asyncio.gather(
+            run_in_threadpool(fetch_order),
+            lnmo_repository.generate_access_token()
+        )
+
         if not order:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="Order not found"
             )
-        
-        # Check if order already has a successful payment
-        existing_transaction = db.query(models.Transaction).filter(
-            models.Transaction._pid == transaction_data.order_id,
-            models.Transaction._status == models.TransactionStatus.ACCEPTED
-        ).first()
-        
+
         if existing_transaction:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
@@ -273,9 +351,9 @@ async def initiate_payment(
             "order_id": transaction_data.order_id
         }
         
-        response = await lnmo_repository.transact(data, db, user.get("id"))
+        response = await lnmo_repository.transact(data, db, user.get("id"), access_token)
         
-        return APIResponse(
+        return APIResponse.model_construct(
             status="success",
             message="Payment initiated successfully",
             data=response
@@ -284,13 +362,113 @@ async def initiate_payment(
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Error initiating payment: {str(e)}")
+        logger.error("Error initiating payment: %s", e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Failed to initiate payment"
         )
 
 
+@router.post("/lnmo/transact/bulk", response_model=APIResponse)
+async def initiate_bulk_payment(
+    transactions_data: Annotated[List[TransactionRequest], Body(min_length=1, max_length=100)],
+    user: user_dependency,
+    db: db_dependency
+):
+    """Initiate MPESA LNMO payments for several orders at once, reporting each one separately"""
+    order_ids = {t.order_id for t in transactions_data}
+
+    def fetch_payable_orders():
+        # Orders that belong to the user and have no successful payment yet, in two queries
+        owned = {
+            order_id for (order_id,) in db.query(models.Orders.order_id).filter(
+                models.Orders.order_id.in_(order_ids),
+                models.Orders.user_id == user.get("id")
+            )
+        }
+        paid = {
+            pid for (pid,) in db.query(models.Transaction._pid).filter(
+                models.Transaction._pid.in_(owned),
+                models.Transaction._status == models.TransactionStatus.ACCEPTED
+            )
+        } if owned else set()
+        return owned, paid
+
+    try:
+        (owned, paid), access_token = await asyncio.gather(
+            run_in_threadpool(fetch_payable_orders),
+            lnmo_repository.generate_access_token()
+        )
+
+        results: List[Dict[str, Any]] = []
+        items = []
+        seen = set()
+        for t in transactions_data:
+            result = {"order_id": t.order_id}
+            results.append(result)
+            if t.order_id in seen:
+                # Only one STK push per order, even if the batch repeats it
+                result.update(status="error", detail="Duplicate order in request")
+                continue
+            seen.add(t.order_id)
+            if t.order_id not in owned:
+                result.update(status="error", detail="Order not found")
+            elif t.order_id in paid:
+                result.update(status="error", detail="Order already has a successful payment")
+            else:
+                items.append((result, {
+                    "amount": t.amount,
+                    "phone_number": t.phone_number,
+                    "order_id": t.order_id
+                }))
+
+        _, responses = await lnmo_repository.push_many(
+            [data for _, data in items], access_token
+        )
+
+        transactions = []
+        for (result, data), response in zip(items, responses):
+            if isinstance(response, Exception):
+                logger.error("STK push failed for order %s: %s", data['order_id'], response)
+                result.update(status="error", detail="Failed to reach M-Pesa")
+                continue
+            try:
+                response_data = response.json()
+            except ValueError:
+                # A gateway error page instead of JSON; keep going so accepted pushes are still saved
+                logger.error("Non-JSON STK push response for order %s: %s %s", data['order_id'], response.status_code, response.text[:200])
+                result.update(status="error", detail="Invalid response from M-Pesa")
+                continue
+            if not response_data.get("CheckoutRequestID"):
+                result.update(status="error", detail="Payment request rejected", data=response_data)
+                continue
+            transactions.append(
+                lnmo_repository._transaction_record(data, response_data, user.get("id"))
+            )
+            result.update(status="success", data=response_data)
+
+        if transactions:
+            db.bulk_save_objects(transactions)
+            db.commit()
+        logger.info("Bulk payment: %s/%s STK pushes initiated for user %s", len(transactions), len(results), user.get('id'))
+
+        return APIResponse.model_construct(
+            status="success",
+            message=f"{len(transactions)} of {len(results)} payments initiated",
+            data={"results": results}
+        )
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        db.rollback()
+        logger.error("Error initiating bulk payment: %s", e)
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Failed to initiate bulk payment"
+        )
+
+
 @router.post("/lnmo/query", response_model=APIResponse)
 async def query_payment(
     query_data: QueryRequest,
@@ -298,9 +476,9 @@ async def query_payment(
 ):
     """Query MPESA LNMO transaction status"""
     try:
-        response = lnmo_repository.query(query_data.checkout_request_id)
+        response = await lnmo_repository.query(query_data.checkout_request_id)
         
-        return APIResponse(
+        return APIResponse.model_construct(
             status="success",
             message="Query completed successfully",
             data=response
@@ -309,47 +487,77 @@ async def query_payment(
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Error querying payment: {str(e)}")
+        logger.error("Error querying payment: %s", e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Failed to query payment"
         )
 
 
+def process_callback(data: Dict[str, Any]) -> None:
+    """Apply an MPESA callback to its transaction after the webhook has been acknowledged"""
+    # A plain def, so Starlette runs the blocking DB work in its threadpool rather than on the event loop.
+    # The request-scoped session is closed once the response is sent, so open our own
+    db = SessionLocal()
+    try:
+        lnmo_repository.callback(data, db)
+    except Exception as e:
+        logger.error("Error processing callback: %s", e)
+    finally:
+        db.close()
+
+
 @router.post("/lnmo/callback")
 async def payment_callback(
     callback_data: CallbackRequest,
-    db: db_dependency
+    background_tasks: BackgroundTasks
 ):
     """Handle MPESA callback (webhook endpoint)"""
-    try:
-        logger.info(f"Received callback: {callback_data}")
-        
-        response = await lnmo_repository.callback(callback_data.dict(), db)
-        
-        return {
-            "ResultCode": 0,
-            "ResultDesc": "Success"
-        }
-        
-    except Exception as e:
-        logger.error(f"Error processing callback: {str(e)}")
-        return {
-            "ResultCode": 1,
-            "ResultDesc": "Failed"
-        }
+    logger.debug("Received callback: %s", callback_data)
+
+    # Safaricom only needs the acknowledgement; update the transaction in the background
+    # mode="json" yields JSON-ready primitives straight from pydantic-core for the JSON column
+    background_tasks.add_task(process_callback, callback_data.model_dump(mode="json"))
+
+    return {
+        "ResultCode": 0,
+        "ResultDesc": "Success"
+    }
 
 
 @router.get("/transactions", status_code=status.HTTP_200_OK)
 async def get_user_transactions(
     user: user_dependency,
-    db: db_dependency
+    db: db_dependency,
+    cursor: Optional[int] = None,
+    limit: int = Query(20, ge=1, le=100)
 ):
-    """Get user's transaction history"""
+    """Get user's transaction history, newest first, paginated by transaction id cursor"""
     try:
-        transactions = db.query(models.Transaction).filter(
+        # Only load the listed columns; _feedback in particular can be large
+        query = db.query(models.Transaction).options(
+            load_only(
+                models.Transaction.id,
+                models.Transaction._pid,
+                models.Transaction.transaction_amount,
+                models.Transaction._status,
+                models.Transaction.transaction_code,
+                models.Transaction.transaction_id,
+                models.Transaction.created_at,
+                models.Transaction.party_a,
+            )
+        ).filter(
             models.Transaction.user_id == user.get("id")
-        ).order_by(models.Transaction.created_at.desc()).all()
+        )
+        if cursor is not None:
+            query = query.filter(models.Transaction.id < cursor)
+
+        # Seek past the cursor instead of OFFSET; the extra row tells us whether another page exists
+        transactions = query.order_by(models.Transaction.id.desc()).limit(limit + 1).all()
+        next_cursor = None
+        if len(transactions) > limit:
+            transactions = transactions[:limit]
+            next_cursor = transactions[-1].id
         
         return {
             "transactions": [
@@ -364,11 +572,12 @@ async def get_user_transactions(
                     "phone_number": t.party_a
                 }
                 for t in transactions
-            ]
+            ],
+            "next_cursor": next_cursor
         }
         
     except Exception as e:
-        logger.error(f"Error fetching transactions: {str(e)}")
+        logger.error("Error fetching transactions: %s", e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Failed to fetch transactions"
@@ -419,7 +628,7 @@ async def get_transaction_by_order_id(
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Error fetching transaction: {str(e)}")
+        logger.error("Error fetching transaction: %s", e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Failed to fetch transaction"
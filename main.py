@@ -1,37 +1,71 @@
-from fastapi import FastAPI, HTTPException, Depends, status, UploadFile, File, Query
+from fastapi import FastAPI, HTTPException, Depends, status, UploadFile, File, Query, Request, Response
 from pydantic_models import (
     ProductsBase, CartPayload, CartItem, UpdateProduct, CategoryBase, CategoryResponse,
     ProductResponse, OrderResponse, OrderDetailResponse, Role, PaginatedProductResponse,
      ImageResponse, AddressCreate, AddressResponse, PaginatedOrderResponse, OrderStatus,
-       PaginatedOrderWithUserResponse, UpdateOrderStatusRequest)
+       PaginatedOrderWithUserResponse, UpdateOrderStatusRequest, CursorPaginatedProductResponse,
+        CursorPaginatedOrderResponse)
 from typing import Annotated, List, Optional
+from pydantic import TypeAdapter
 import models
-from database import engine, db_dependency
-from sqlalchemy.orm import Session, joinedload
+import cache
+from database import async_engine, async_db_dependency
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import joinedload, load_only, selectinload
+from sqlalchemy.dialects.mysql import match as mysql_match
 from sqlalchemy.exc import SQLAlchemyError
 import auth
 from auth import get_active_user
 from fastapi.middleware.cors import CORSMiddleware
-from sqlalchemy import func
-from datetime import datetime
+from sqlalchemy import and_, func, case, delete, exists, insert, literal, select, union_all, update, tuple_, Integer, Numeric
+from datetime import datetime, time, timedelta
 import logging
 from dotenv import load_dotenv
 import os
 from decimal import Decimal
 from math import ceil
+import base64
+import binascii
+import json
+import orjson
+import re
 import uuid
+import hashlib
 from pathlib import Path
+import aiofiles
+import aiofiles.os
 from fastapi.staticfiles import StaticFiles
+from contextlib import asynccontextmanager
+import httpx
 import lnmo
 load_dotenv()
 
+# Logging is configured once here for the whole app, including the auth and lnmo routers
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-app = FastAPI()
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # One keep-alive client for all Safaricom calls, shared by the LNMO repository
+    async with httpx.AsyncClient(
+        base_url=lnmo.lnmo_repository.base_url,
+        timeout=10.0,
+        limits=httpx.Limits(max_keepalive_connections=20),
+    ) as mpesa_client:
+        app.state.mpesa_client = mpesa_client
+        lnmo.lnmo_repository.client = mpesa_client
+        yield
+        lnmo.lnmo_repository.client = None
+    await cache.redis_client.aclose()
+    await async_engine.dispose()
+
+
+# No default_response_class: routes with a response_model serialize straight to JSON bytes in pydantic-core
+app = FastAPI(lifespan=lifespan)
 app.include_router(auth.router)
 app.include_router(lnmo.router)
-models.Base.metadata.create_all(bind=engine) 
+# The schema is managed by Alembic migrations (alembic upgrade head), not created at startup
 
 app.add_middleware(
     CORSMiddleware,
@@ -39,13 +73,15 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    # Let browser clients read the Location of newly created resources
+    expose_headers=["Location"],
 )
 
 
 user_dependency = Annotated[dict, Depends(get_active_user)]
 
 def require_admin(user: user_dependency):
-    print(f"User role: {user.get('role')}")
+    logger.debug("User role: %s", user.get("role"))
     try:
         user_role = Role(user.get("role"))  # Convert string to Role enum
     except ValueError:
@@ -57,9 +93,128 @@ def require_admin(user: user_dependency):
 
 
 
+# Public catalog responses are cached as final JSON bytes under a namespace epoch that every catalog write bumps
+CATALOG_CACHE_NAMESPACE = "products"
+CATALOG_CACHE_TTL = 30
+category_list_adapter = TypeAdapter(List[CategoryResponse])
+
+# Dashboard figures tolerate a little staleness, so they simply expire rather than being cleared
+DASHBOARD_CACHE_NAMESPACE = "dashboard"
+DASHBOARD_CACHE_TTL = 60
+# Per-user product counts live in Redis; add/delete drop the key and the next reader re-counts.
+# The short TTL bounds how long a count raced by a concurrent write can survive
+PRODUCT_COUNT_TTL = 300
+
+
+def product_count_key(user_id) -> str:
+    return cache.key("u", user_id, "product_count")
+
+
+async def get_product_count(db: AsyncSession, user_id) -> int:
+    count_key = product_count_key(user_id)
+    cached = await cache.get(count_key)
+    if cached is not None:
+        return int(cached)
+    # End the caller's read snapshot so the COUNT sees every committed product
+    await db.rollback()
+    total = await db.scalar(
+        select(func.count(models.Products.id)).where(models.Products.user_id == user_id)
+    )
+    # NX: never overwrite a count another request stored after ours started
+    await cache.set(count_key, str(total).encode(), PRODUCT_COUNT_TTL, nx=True)
+    return total
+
+
+def json_response(body: bytes) -> Response:
+    return Response(content=body, media_type="application/json")
+
+
+# Browsers and CDNs may reuse public catalog responses for as long as the Redis copy lives
+PUBLIC_CACHE_CONTROL = f"public, max-age={CATALOG_CACHE_TTL}, stale-while-revalidate=60"
+
+
+def public_json_response(request: Request, body: bytes) -> Response:
+    """Serve public JSON with a strong ETag, answering a matching If-None-Match with an empty 304"""
+    etag = f'"{hashlib.blake2b(body, digest_size=16).hexdigest()}"'
+    headers = {"ETag": etag, "Cache-Control": PUBLIC_CACHE_CONTROL}
+    # If-None-Match uses weak comparison (RFC 9110 13.1.2); proxies that gzip often send W/"..."
+    if_none_match = {
+        tag.strip().removeprefix("W/") for tag in request.headers.get("if-none-match", "").split(",")
+    }
+    if etag in if_none_match or "*" in if_none_match:
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    return Response(content=body, media_type="application/json", headers=headers)
+
+
+# The products.name FULLTEXT index uses the ngram parser, which indexes every run of this many characters
+NGRAM_TOKEN_SIZE = int(os.getenv("NGRAM_TOKEN_SIZE", "2"))
+
+
+def product_name_search(search: str):
+    """
+    Substring match on products.name ('%search%') that narrows rows through the ngram FULLTEXT
+    index first: every word long enough to be indexed must appear as an ngram phrase, and the
+    ILIKE rechecks the exact substring. Searches with no indexable word use the ILIKE alone
+    """
+    substring = models.Products.name.ilike(f"%{search}%")
+    words = [word for word in re.findall(r"\w+", search) if len(word) >= NGRAM_TOKEN_SIZE]
+    if not words:
+        return substring
+    terms = " ".join(f'+"{word}"' for word in words)
+    return and_(mysql_match(models.Products.name, against=terms).in_boolean_mode(), substring)
+
+
+def encode_cursor(*values) -> str:
+    return base64.urlsafe_b64encode(json.dumps(values).encode()).decode()
+
+
+def decode_cursor(cursor: str) -> list:
+    try:
+        values = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+    except (binascii.Error, UnicodeDecodeError, ValueError):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+    if not isinstance(values, list):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+    return values
+
+
+async def fetch_product_page(db: AsyncSession, query, cursor: Optional[str], limit: int) -> dict:
+    """Seek one page of products ordered by (created_at DESC, id DESC)"""
+    if cursor:
+        try:
+            created_at, product_id = decode_cursor(cursor)
+            seek = (datetime.fromisoformat(created_at), int(product_id))
+        except (TypeError, ValueError):
+            raise HTTPException(status_code=400, detail="Invalid cursor")
+        query = query.where(tuple_(models.Products.created_at, models.Products.id) < seek)
+
+    # Fetch one extra row to learn whether there is a next page without a COUNT
+    products = (await db.execute(
+        query
+        .options(selectinload(models.Products.category))
+        .order_by(models.Products.created_at.desc(), models.Products.id.desc())
+        .limit(limit + 1)
+    )).scalars().all()
+    next_cursor = None
+    if len(products) > limit:
+        products = products[:limit]
+        last = products[-1]
+        next_cursor = encode_cursor(last.created_at.isoformat(), last.id)
+    return {"items": products, "next_cursor": next_cursor, "limit": limit}
+
+
 # Ensure uploads directory exists
 UPLOAD_DIR = Path("uploads")
 UPLOAD_DIR.mkdir(exist_ok=True)
+MAX_UPLOAD_SIZE = 5 * 1024 * 1024  # 5MB in bytes
+UPLOAD_CHUNK_SIZE = 64 * 1024
+ALLOWED_IMAGE_EXTENSIONS = {"jpg", "jpeg", "png", "gif"}
+# Leading bytes of each accepted format; content_type and extension are client-controlled
+IMAGE_SIGNATURES = (
+    b"\xff\xd8\xff",  # JPEG
+    b"\x89PNG\r\n\x1a\n",  # PNG
+    b"GIF8",  # GIF87a / GIF89a
+)
 
 app.mount("/uploads", StaticFiles(directory="uploads"), name="uploads")
 
@@ -67,123 +222,205 @@ app.mount("/uploads", StaticFiles(directory="uploads"), name="uploads")
 @app.post("/upload-image", response_model=ImageResponse, status_code=status.HTTP_201_CREATED)
 async def upload_image(user: user_dependency, file: UploadFile = File(...)):
     require_admin(user)
+    # Validate file type and extension before reading any bytes
+    if not (file.content_type or "").startswith("image/"):
+        raise HTTPException(status_code=400, detail="Only image files are allowed")
+    file_extension = (file.filename or "").split(".")[-1].lower()
+    if file_extension not in ALLOWED_IMAGE_EXTENSIONS:
+        raise HTTPException(status_code=400, detail="Unsupported image format")
+
+    # Sniff the real format before anything touches the disk
+    header = await file.read(12)
+    await file.seek(0)
+    if not header.startswith(IMAGE_SIGNATURES):
+        raise HTTPException(status_code=400, detail="File content is not a supported image")
+
+    temp_path = UPLOAD_DIR / f".{uuid.uuid4()}.part"
     try:
-        # Validate file type
-        if not file.content_type.startswith("image/"):
-            raise HTTPException(status_code=400, detail="Only image files are allowed")
-        
-        # Validate file size (e.g., max 5MB)
-        max_size = 5 * 1024 * 1024  # 5MB in bytes
-        content = await file.read()
-        if len(content) > max_size:
-            raise HTTPException(status_code=400, detail="File size exceeds 5MB limit")
-        
-        # Generate unique filename
-        file_extension = file.filename.split(".")[-1].lower()
-        if file_extension not in ["jpg", "jpeg", "png", "gif"]:
-            raise HTTPException(status_code=400, detail="Unsupported image format")
-        unique_filename = f"{uuid.uuid4()}.{file_extension}"
+        # Stream to a temp file in fixed chunks, hashing as we go so memory stays flat
+        digest = hashlib.sha256()
+        size = 0
+        async with aiofiles.open(temp_path, "wb") as f:
+            while chunk := await file.read(UPLOAD_CHUNK_SIZE):
+                size += len(chunk)
+                if size > MAX_UPLOAD_SIZE:
+                    raise HTTPException(status_code=400, detail="File size exceeds 5MB limit")
+                digest.update(chunk)
+                await f.write(chunk)
+
+        # Content-addressed name, so identical uploads are only stored once
+        unique_filename = f"{digest.hexdigest()}.{file_extension}"
         file_path = UPLOAD_DIR / unique_filename
-        
-        # Save file
-        with file_path.open("wb") as f:
-            f.write(content)
+        if await aiofiles.os.path.exists(file_path):
+            await aiofiles.os.remove(temp_path)
+        else:
+            await aiofiles.os.replace(temp_path, file_path)
         
         # Generate URL (assuming static file serving or CDN in production)
         img_url = f"/uploads/{unique_filename}"
         
-        logger.info(f"Image uploaded: {unique_filename} by user {user.get('id')}")
+        logger.info("Image uploaded: %s by user %s", unique_filename, user.get('id'))
         return {"message": "Image uploaded successfully", "img_url": img_url}
+    except HTTPException:
+        raise
     except Exception as e:
-        logger.error(f"Error uploading image: {str(e)}")
+        logger.error("Error uploading image: %s", e)
         raise HTTPException(status_code=500, detail="Error uploading image")
+    finally:
+        # Drop the partial upload if it was rejected or failed midway
+        if await aiofiles.os.path.exists(temp_path):
+            await aiofiles.os.remove(temp_path)
 
 @app.get("/public/products", response_model=PaginatedProductResponse, status_code=status.HTTP_200_OK)
-async def browse_products(db: db_dependency, search: str = None, page: int = 1, limit: int = 10):
+async def browse_products(request: Request, db: async_db_dependency, search: str = None, page: int = 1, limit: int = 10, include_total: bool = False):
+    cache_key = await cache.versioned_key(CATALOG_CACHE_NAMESPACE, "browse", search or "", page, limit, int(include_total))
+    cached = await cache.get(cache_key)
+    if cached is not None:
+        return public_json_response(request, cached)
     try:
         skip = (page - 1) * limit
-        query = db.query(models.Products)
+        query = select(models.Products)
         if search:
-            query = query.filter(models.Products.name.ilike(f"%{search}%"))
-            logger.info(f"Product search query: {search}")
-        total = query.count()
-        products = query.offset(skip).limit(limit).all()
-        total_pages = ceil(total / limit)
-        return {
+            query = query.where(product_name_search(search))
+            logger.info("Product search query: %s", search)
+        total = total_pages = None
+        if include_total:
+            total = await db.scalar(select(func.count()).select_from(query.subquery()))
+            total_pages = ceil(total / limit)
+        products = (await db.execute(
+            query.options(selectinload(models.Products.category)).offset(skip).limit(limit)
+        )).scalars().all()
+        body = PaginatedProductResponse.model_validate({
             "items": products,
             "total": total,
             "page": page,
             "limit": limit,
             "pages": total_pages
-        }
+        }, from_attributes=True).model_dump_json().encode()
     except SQLAlchemyError as e:
-        logger.error(f"Error fetching products: {str(e)}")
+        logger.error("Error fetching products: %s", e)
+        raise HTTPException(status_code=500, detail="Error fetching products")
+    await cache.set(cache_key, body, CATALOG_CACHE_TTL)
+    return public_json_response(request, body)
+
+@app.get("/public/products/cursor", response_model=CursorPaginatedProductResponse, status_code=status.HTTP_200_OK)
+async def browse_products_cursor(
+    db: async_db_dependency,
+    search: str = None,
+    cursor: Optional[str] = None,
+    limit: int = Query(10, ge=1, le=100)
+):
+    """
+    Keyset-paginated product listing for infinite scroll; pass back next_cursor to get the next page
+    """
+    try:
+        query = select(models.Products)
+        if search:
+            query = query.where(product_name_search(search))
+            logger.info("Product search query: %s", search)
+        return await fetch_product_page(db, query, cursor, limit)
+    except SQLAlchemyError as e:
+        logger.error("Error fetching products: %s", e)
         raise HTTPException(status_code=500, detail="Error fetching products")
 
 @app.get("/public/products/{product_id}", response_model=ProductResponse, status_code=status.HTTP_200_OK)
-async def get_product_by_id(product_id: int, db: db_dependency):
+async def get_product_by_id(request: Request, product_id: int, db: async_db_dependency):
+    cache_key = await cache.versioned_key(CATALOG_CACHE_NAMESPACE, "product", product_id)
+    cached = await cache.get(cache_key)
+    if cached is not None:
+        return public_json_response(request, cached)
     try:
-        product = db.query(models.Products).filter(models.Products.id == product_id).first()
+        product = (await db.execute(
+            select(models.Products)
+            .where(models.Products.id == product_id)
+            .options(selectinload(models.Products.category))
+        )).scalars().first()
         if not product:
-            logger.info(f"Product not found: ID {product_id}")
+            logger.info("Product not found: ID %s", product_id)
             raise HTTPException(status_code=404, detail="Product not found")
-        return product
+        body = ProductResponse.model_validate(product, from_attributes=True).model_dump_json().encode()
     except SQLAlchemyError as e:
-        logger.error(f"Error fetching product by ID {product_id}: {str(e)}")
+        logger.error("Error fetching product by ID %s: %s", product_id, e)
         raise HTTPException(status_code=500, detail="Error fetching product")
+    await cache.set(cache_key, body, CATALOG_CACHE_TTL)
+    return public_json_response(request, body)
 
 @app.get("/public/categories", response_model=List[CategoryResponse], status_code=status.HTTP_200_OK)
-async def browse_categories(db: db_dependency):
+async def browse_categories(request: Request, db: async_db_dependency):
+    cache_key = await cache.versioned_key(CATALOG_CACHE_NAMESPACE, "categories")
+    cached = await cache.get(cache_key)
+    if cached is not None:
+        return public_json_response(request, cached)
     try:
-        categories = db.query(models.Categories).all()
-        return categories
+        categories = (await db.execute(select(models.Categories))).scalars().all()
+        body = category_list_adapter.dump_json(
+            category_list_adapter.validate_python(categories, from_attributes=True)
+        )
     except SQLAlchemyError as e:
-        logger.error(f"Error fetching categories: {str(e)}")
+        logger.error("Error fetching categories: %s", e)
         raise HTTPException(status_code=500, detail="Error fetching categories")
+    await cache.set(cache_key, body, CATALOG_CACHE_TTL)
+    return public_json_response(request, body)
 
 @app.post("/categories", response_model=CategoryResponse, status_code=status.HTTP_201_CREATED)
-async def create_category(user: user_dependency, db: db_dependency, category: CategoryBase):
+async def create_category(user: user_dependency, db: async_db_dependency, category: CategoryBase):
     require_admin(user)
     try:
-        db_category = models.Categories(**category.dict())
+        db_category = models.Categories(**category.model_dump())
         db.add(db_category)
-        db.commit()
-        db.refresh(db_category)
+        await db.commit()
+        await cache.clear(CATALOG_CACHE_NAMESPACE)
         return db_category
     except SQLAlchemyError as e:
-        db.rollback()
-        logger.error(f"Error creating category: {str(e)}")
+        await db.rollback()
+        logger.error("Error creating category: %s", e)
         raise HTTPException(status_code=500, detail=str(e))
 
 @app.post("/products", status_code=status.HTTP_201_CREATED)
-async def add_product(user: user_dependency, db: db_dependency, create_product: ProductsBase):
+async def add_product(user: user_dependency, db: async_db_dependency, create_product: ProductsBase):
     require_admin(user)
     try:
         add_product = models.Products(
-            **create_product.dict(),
+            **create_product.model_dump(),
             user_id=user.get("id")
         )
         db.add(add_product)
-        db.commit()
-        db.refresh(add_product)
-        return {"message": "Product added successfully"}
+        await db.commit()
+        await cache.delete(product_count_key(user.get("id")))
+        await cache.clear(CATALOG_CACHE_NAMESPACE)
+        # No body; the Location header points at the new product
+        return Response(
+            status_code=status.HTTP_201_CREATED,
+            headers={"Location": f"/public/products/{add_product.id}"}
+        )
     except SQLAlchemyError as e:
-        db.rollback()
-        logger.error(f"Error adding product: {str(e)}")
+        await db.rollback()
+        logger.error("Error adding product: %s", e)
         raise HTTPException(status_code=500, detail=str(e))
 
 @app.get("/products", response_model=PaginatedProductResponse, status_code=status.HTTP_200_OK)
-async def fetch_products(user: user_dependency, db: db_dependency, search: str = None, page: int = 1, limit: int = 10):
+async def fetch_products(user: user_dependency, db: async_db_dependency, search: str = None, page: int = 1, limit: int = 10, include_total: bool = False):
     require_admin(user)
     try:
         skip = (page - 1) * limit
-        query = db.query(models.Products).filter(models.Products.user_id == user.get("id"))
+        query = select(models.Products).where(models.Products.user_id == user.get("id"))
         if search:
-            query = query.filter(models.Products.name.ilike(f"%{search}%"))
-            logger.info(f"Admin product search query: {search}")
-        total = query.count()
-        products = query.offset(skip).limit(limit).all()
-        total_pages = ceil(total / limit)
+            query = query.where(product_name_search(search))
+            logger.info("Admin product search query: %s", search)
+        total = total_pages = None
+        if include_total:
+            # Admin screens re-read the same count on every page, so keep it briefly in Redis
+            count_key = await cache.versioned_key(CATALOG_CACHE_NAMESPACE, "count", user.get("id"), search or "")
+            cached = await cache.get(count_key)
+            if cached is not None:
+                total = int(cached)
+            else:
+                total = await db.scalar(select(func.count()).select_from(query.subquery()))
+                await cache.set(count_key, str(total).encode(), CATALOG_CACHE_TTL)
+            total_pages = ceil(total / limit)
+        products = (await db.execute(
+            query.options(selectinload(models.Products.category)).offset(skip).limit(limit)
+        )).scalars().all()
         return {
             "items": products,
             "total": total,
@@ -192,152 +429,242 @@ async def fetch_products(user: user_dependency, db: db_dependency, search: str =
             "pages": total_pages
         }
     except SQLAlchemyError as e:
-        logger.error(f"Error fetching products: {str(e)}")
+        logger.error("Error fetching products: %s", e)
+        raise HTTPException(status_code=500, detail="Error fetching products")
+
+@app.get("/products/cursor", response_model=CursorPaginatedProductResponse, status_code=status.HTTP_200_OK)
+async def fetch_products_cursor(
+    user: user_dependency,
+    db: async_db_dependency,
+    search: str = None,
+    cursor: Optional[str] = None,
+    limit: int = Query(10, ge=1, le=100)
+):
+    require_admin(user)
+    try:
+        query = select(models.Products).where(models.Products.user_id == user.get("id"))
+        if search:
+            query = query.where(product_name_search(search))
+            logger.info("Admin product search query: %s", search)
+        return await fetch_product_page(db, query, cursor, limit)
+    except SQLAlchemyError as e:
+        logger.error("Error fetching products: %s", e)
         raise HTTPException(status_code=500, detail="Error fetching products")
 
-@app.put("/update-product/{product_id}", status_code=status.HTTP_200_OK)
-async def update_product(product_id: int, updated_data: UpdateProduct, user: user_dependency, db: db_dependency):
+@app.put("/update-product/{product_id}", status_code=status.HTTP_204_NO_CONTENT)
+async def update_product(product_id: int, updated_data: UpdateProduct, user: user_dependency, db: async_db_dependency):
     require_admin(user)
     try:
-        product = db.query(models.Products).filter(
-            models.Products.id == product_id,
-            models.Products.user_id == user.get("id")
-        ).first()
+        product = (await db.execute(
+            select(models.Products).where(
+                models.Products.id == product_id,
+                models.Products.user_id == user.get("id")
+            )
+        )).scalars().first()
         if not product:
             raise HTTPException(status_code=404, detail="Product not found")
-        update_dict = updated_data.dict(exclude_unset=True)
+        update_dict = updated_data.model_dump(exclude_unset=True)
         for key, value in update_dict.items():
             setattr(product, key, value)
-        db.commit()
-        db.refresh(product)
-        return {"message": "Product updated successfully"}
+        await db.commit()
+        await cache.clear(CATALOG_CACHE_NAMESPACE)
+        return Response(status_code=status.HTTP_204_NO_CONTENT)
     except SQLAlchemyError as e:
-        db.rollback()
-        logger.error(f"Error updating product: {str(e)}")
+        await db.rollback()
+        logger.error("Error updating product: %s", e)
         raise HTTPException(status_code=500, detail=str(e))
 
-@app.delete("/delete-product/{product_id}", status_code=status.HTTP_200_OK)
-async def delete_product(product_id: int, db: db_dependency, user: user_dependency):
+@app.delete("/delete-product/{product_id}", status_code=status.HTTP_204_NO_CONTENT)
+async def delete_product(product_id: int, db: async_db_dependency, user: user_dependency):
     require_admin(user)
     try:
-        product = db.query(models.Products).filter(
-            models.Products.id == product_id,
-            models.Products.user_id == user.get("id")
-        ).first()
-        if not product:
-            raise HTTPException(status_code=404, detail="Product not found")
-        order_details = db.query(models.OrderDetails).filter(models.OrderDetails.product_id == product_id).first()
-        if order_details:
+        # Delete only if the product is ours and has never been ordered, in one statement
+        result = await db.execute(
+            delete(models.Products)
+            .where(
+                models.Products.id == product_id,
+                models.Products.user_id == user.get("id"),
+                ~exists().where(models.OrderDetails.product_id == product_id)
+            )
+            .execution_options(synchronize_session=False)
+        )
+        if result.rowcount == 0:
+            # Rare path: work out which condition failed
+            await db.rollback()
+            found = await db.scalar(
+                select(models.Products.id).where(
+                    models.Products.id == product_id,
+                    models.Products.user_id == user.get("id")
+                )
+            )
+            if found is None:
+                raise HTTPException(status_code=404, detail="Product not found")
             raise HTTPException(status_code=400, detail="Cannot delete product with existing orders")
-        db.delete(product)
-        db.commit()
-        return {"message": "Product deleted successfully"}
+        await db.commit()
+        await cache.delete(product_count_key(user.get("id")))
+        await cache.clear(CATALOG_CACHE_NAMESPACE)
+        return Response(status_code=status.HTTP_204_NO_CONTENT)
     except SQLAlchemyError as e:
-        db.rollback()
-        logger.error(f"Error deleting product: {str(e)}")
+        await db.rollback()
+        logger.error("Error deleting product: %s", e)
         raise HTTPException(status_code=500, detail=str(e))
 
 
 # Update your create_order function to handle the new transaction relationship:
 @app.post("/create_order", status_code=status.HTTP_201_CREATED)
-async def create_order(db: db_dependency, user: user_dependency, order_payload: CartPayload):
+async def create_order(db: async_db_dependency, user: user_dependency, order_payload: CartPayload):
     try:
         # Validate address if provided
         address_id = order_payload.address_id
         if address_id:
-            address = db.query(models.Address).filter(
-                models.Address.id == address_id,
-                models.Address.user_id == user.get("id")
-            ).first()
+            address = (await db.execute(
+                select(models.Address).where(
+                    models.Address.id == address_id,
+                    models.Address.user_id == user.get("id")
+                )
+            )).scalars().first()
             if not address:
                 raise HTTPException(status_code=400, detail="Invalid address ID")
         
         # Convert delivery fee to Decimal for precise arithmetic
         delivery_fee = Decimal(str(order_payload.delivery_fee))
         
-        # Create new order with default status PENDING
-        new_order = models.Orders(
-            user_id=user.get("id"),
-            total=0,
-            address_id=address_id,
-            delivery_fee=delivery_fee,
-            status=OrderStatus.PENDING  # Initial status
-        )
-        db.add(new_order)
-        db.commit()
-        db.refresh(new_order)
-        
-        # Process cart items and calculate total cost
-        total_cost = Decimal('0')
+        if not order_payload.cart:
+            raise HTTPException(status_code=400, detail="Cart is empty")
+
+        # The cart as an inline derived table (MySQL has no VALUES lists or writable CTEs), so the
+        # database does the price * quantity math instead of a Python Decimal loop
+        cart = union_all(*(
+            select(
+                literal(item.id, Integer).label("product_id"),
+                literal(Decimal(str(item.quantity)), Numeric(15, 2)).label("quantity"),
+            )
+            for item in order_payload.cart
+        )).subquery("cart")
+
+        # One locked read returns stock, requested quantity and line totals for every product in the cart
+        rows = (await db.execute(
+            select(
+                models.Products.id,
+                models.Products.name,
+                models.Products.stock_quantity,
+                func.sum(cart.c.quantity).label("requested"),
+                func.sum(models.Products.price * cart.c.quantity).label("line_total"),
+            )
+            .join(cart, cart.c.product_id == models.Products.id)
+            .group_by(models.Products.id)
+            .with_for_update()
+        )).all()
+
+        found = {row.id: row for row in rows}
         for item in order_payload.cart:
-            product = db.query(models.Products).filter_by(id=item.id).first()
-            if not product:
-                db.rollback()
+            if item.id not in found:
+                await db.rollback()
                 raise HTTPException(status_code=404, detail=f"Product ID {item.id} not found")
-            quantity = Decimal(str(item.quantity))
-            if product.stock_quantity < quantity:
-                db.rollback()
-                raise HTTPException(status_code=400, detail=f"Insufficient stock for product {product.name}")
-            
-            # Create order detail entry
-            order_detail = models.OrderDetails(
-                order_id=new_order.order_id,
-                product_id=product.id,
-                quantity=quantity,
-                total_price=product.price * quantity,
-            )
-            total_cost += order_detail.total_price
-            product.stock_quantity -= quantity
-            db.add(order_detail)
-        
-        # Update order total with cart total plus delivery fee
-        new_order.total = total_cost + new_order.delivery_fee
+        for row in rows:
+            if row.stock_quantity < row.requested:
+                await db.rollback()
+                raise HTTPException(status_code=400, detail=f"Insufficient stock for product {row.name}")
+        requested = {row.id: row.requested for row in rows}  # product_id -> quantity taken from stock
+        total_cost = sum((row.line_total for row in rows), Decimal('0'))
+
+        # Order total is the cart total plus delivery fee
+        order_total = total_cost + delivery_fee
+        order_status = OrderStatus.PENDING  # Initial status
         
         # Handle transaction linking if transaction_id is provided
+        transaction = None
         if order_payload.transaction_id:
-            transaction = db.query(models.Transaction).filter(
-                models.Transaction.id == order_payload.transaction_id,
-                models.Transaction.user_id == user.get("id"),
-                models.Transaction.order_id.is_(None),  # Ensure transaction isn't already linked
-                models.Transaction._status == models.TransactionStatus.ACCEPTED  # ACCEPTED status
-            ).first()
+            transaction = (await db.execute(
+                select(models.Transaction).where(
+                    models.Transaction.id == order_payload.transaction_id,
+                    models.Transaction.user_id == user.get("id"),
+                    models.Transaction.order_id.is_(None),  # Ensure transaction isn't already linked
+                    models.Transaction._status == models.TransactionStatus.ACCEPTED  # ACCEPTED status
+                )
+            )).scalars().first()
             if not transaction:
-                db.rollback()
+                await db.rollback()
                 raise HTTPException(status_code=400, detail="Invalid or already used transaction")
-            if transaction.transaction_amount < new_order.total:
-                db.rollback()
+            if transaction.transaction_amount < order_total:
+                await db.rollback()
                 raise HTTPException(status_code=400, detail="Insufficient transaction amount")
-            # Link transaction to order and update status
-            transaction.order_id = new_order.order_id
-            new_order.status = OrderStatus.PROCESSING  # Payment confirmed, ready for processing
+            order_status = OrderStatus.PROCESSING  # Payment confirmed, ready for processing
+
+        # Insert the header as a Core statement; MySQL has no RETURNING, so the id comes from lastrowid
+        order_id = (await db.execute(
+            insert(models.Orders).values(
+                user_id=user.get("id"),
+                total=order_total,
+                address_id=address_id,
+                delivery_fee=delivery_fee,
+                status=order_status,
+            )
+        )).inserted_primary_key[0]
+
+        # INSERT ... SELECT writes every cart line with its price from the locked product rows,
+        # then one UPDATE covers every stock decrement
+        await db.execute(
+            insert(models.OrderDetails).from_select(
+                ["order_id", "product_id", "quantity", "total_price"],
+                select(
+                    literal(order_id, Integer),
+                    cart.c.product_id,
+                    cart.c.quantity,
+                    models.Products.price * cart.c.quantity,
+                ).join(models.Products, models.Products.id == cart.c.product_id),
+            )
+        )
+        await db.execute(
+            update(models.Products)
+            .where(models.Products.id.in_(requested))
+            .values(stock_quantity=models.Products.stock_quantity - case(requested, value=models.Products.id))
+            .execution_options(synchronize_session=False)
+        )
+        if transaction:
+            # Link transaction to order
+            transaction.order_id = order_id
         
         # Commit all changes
-        db.commit()
+        await db.commit()
         
-        logger.info(f"Order {new_order.order_id} created for user {user.get('id')}")
-        return {
-            "message": "Order created successfully",
-            "order_id": new_order.order_id,
-        }
+        logger.info("Order %s created for user %s", order_id, user.get('id'))
+        # The frontend needs the id to start payment, so keep it in the body as well as in Location
+        return Response(
+            content=orjson.dumps({"order_id": order_id}),
+            status_code=status.HTTP_201_CREATED,
+            media_type="application/json",
+            headers={"Location": f"/orders/{order_id}"}
+        )
     except SQLAlchemyError as e:
-        db.rollback()
-        logger.error(f"Error creating order: {str(e)}")
+        await db.rollback()
+        logger.error("Error creating order: %s", e)
         raise HTTPException(status_code=500, detail=str(e))
     except ValueError as e:
-        db.rollback()
-        logger.error(f"Invalid quantity value: {str(e)}")
+        await db.rollback()
+        logger.error("Invalid quantity value: %s", e)
         raise HTTPException(status_code=400, detail="Invalid quantity value")
 
 # Add a new endpoint to get available transactions for linking to orders
 @app.get("/available-transactions", status_code=status.HTTP_200_OK)
-async def get_available_transactions(user: user_dependency, db: db_dependency):
+async def get_available_transactions(user: user_dependency, db: async_db_dependency):
     """Get user's accepted transactions that haven't been linked to orders yet"""
     try:
-        transactions = db.query(models.Transaction).filter(
-            models.Transaction.user_id == user.get("id"),
-            models.Transaction._status == models.TransactionStatus.ACCEPTED,
-            models.Transaction.order_id.is_(None)  # Not yet linked to any order
-        ).all()
+        transactions = (await db.execute(
+            select(models.Transaction).options(
+                load_only(
+                    models.Transaction.id,
+                    models.Transaction.transaction_amount,
+                    models.Transaction.transaction_code,
+                    models.Transaction.transaction_timestamp,
+                    models.Transaction.account_reference,
+                )
+            ).where(
+                models.Transaction.user_id == user.get("id"),
+                models.Transaction._status == models.TransactionStatus.ACCEPTED,
+                models.Transaction.order_id.is_(None)  # Not yet linked to any order
+            )
+        )).scalars().all()
         
         return {
             "transactions": [
@@ -352,31 +679,36 @@ async def get_available_transactions(user: user_dependency, db: db_dependency):
             ]
         }
     except SQLAlchemyError as e:
-        logger.error(f"Error fetching available transactions: {str(e)}")
+        logger.error("Error fetching available transactions: %s", e)
         raise HTTPException(status_code=500, detail="Error fetching transactions")
 
 
 @app.get("/orders", response_model=PaginatedOrderResponse, status_code=status.HTTP_200_OK)
 async def fetch_orders(
     user: user_dependency,
-    db: db_dependency,
+    db: async_db_dependency,
     skip: int = Query(0, ge=0),
     limit: int = Query(10, ge=1, le=100),
     status: Optional[OrderStatus] = None
 ):
     try:
-        query = db.query(models.Orders).filter(models.Orders.user_id == user.get("id"))
+        query = select(models.Orders).where(models.Orders.user_id == user.get("id"))
         if status:
-            query = query.filter(models.Orders.status == status)
+            query = query.where(models.Orders.status == status)
         
-        total = query.count()
-        orders = (
+        total = await db.scalar(select(func.count()).select_from(query.subquery()))
+        # Everything the response model touches must be loaded up front; async sessions can't lazy-load
+        orders = (await db.execute(
             query
-            .options(joinedload(models.Orders.order_details).joinedload(models.OrderDetails.product))
+            .options(
+                selectinload(models.Orders.order_details)
+                .joinedload(models.OrderDetails.product)
+                .joinedload(models.Products.category),
+                joinedload(models.Orders.address)
+            )
             .offset(skip)
             .limit(limit)
-            .all()
-        )
+        )).scalars().all()
         page = (skip // limit) + 1
         pages = ceil(total / limit) if limit > 0 else 0
         return {
@@ -390,38 +722,82 @@ async def fetch_orders(
         raise HTTPException(status_code=500, detail="Error fetching orders")
 
 
+@app.get("/orders/cursor", response_model=CursorPaginatedOrderResponse, status_code=status.HTTP_200_OK)
+async def fetch_orders_cursor(
+    user: user_dependency,
+    db: async_db_dependency,
+    cursor: Optional[str] = None,
+    limit: int = Query(10, ge=1, le=100),
+    status: Optional[OrderStatus] = None
+):
+    """
+    Keyset-paginated orders for the authenticated user, newest first
+    """
+    try:
+        query = select(models.Orders).where(models.Orders.user_id == user.get("id"))
+        if status:
+            query = query.where(models.Orders.status == status)
+        if cursor:
+            try:
+                (order_id,) = decode_cursor(cursor)
+                query = query.where(models.Orders.order_id < int(order_id))
+            except (TypeError, ValueError):
+                raise HTTPException(status_code=400, detail="Invalid cursor")
+
+        orders = (await db.execute(
+            query
+            .options(
+                selectinload(models.Orders.order_details)
+                .joinedload(models.OrderDetails.product)
+                .joinedload(models.Products.category),
+                joinedload(models.Orders.address)
+            )
+            .order_by(models.Orders.order_id.desc())
+            .limit(limit + 1)
+        )).scalars().all()
+        next_cursor = None
+        if len(orders) > limit:
+            orders = orders[:limit]
+            next_cursor = encode_cursor(orders[-1].order_id)
+        return {"items": orders, "next_cursor": next_cursor, "limit": limit}
+    except SQLAlchemyError as e:
+        logger.error("Error fetching orders: %s", e)
+        raise HTTPException(status_code=500, detail="Error fetching orders")
+
+
 @app.get("/orders/{order_id}", response_model=OrderResponse, status_code=status.HTTP_200_OK)
 async def get_order_by_id(
     order_id: int,
     user: user_dependency,
-    db: db_dependency
+    db: async_db_dependency
 ):
     """
     Fetch a specific order by ID for the authenticated user
     """
     try:
-        order = (
-            db.query(models.Orders)
-            .filter(
+        order = (await db.execute(
+            select(models.Orders)
+            .where(
                 models.Orders.order_id == order_id,
                 models.Orders.user_id == user.get("id")
             )
             .options(
-                joinedload(models.Orders.order_details).joinedload(models.OrderDetails.product),
+                selectinload(models.Orders.order_details)
+                .joinedload(models.OrderDetails.product)
+                .joinedload(models.Products.category),
                 joinedload(models.Orders.address)
             )
-            .first()
-        )
+        )).scalars().first()
         
         if not order:
-            logger.info(f"Order not found: ID {order_id} for user {user.get('id')}")
+            logger.info("Order not found: ID %s for user %s", order_id, user.get('id'))
             raise HTTPException(status_code=404, detail="Order not found")
         
-        logger.info(f"Retrieved order {order_id} for user {user.get('id')}")
+        logger.info("Retrieved order %s for user %s", order_id, user.get('id'))
         return order
         
     except SQLAlchemyError as e:
-        logger.error(f"Error fetching order {order_id}: {str(e)}")
+        logger.error("Error fetching order %s: %s", order_id, e)
         raise HTTPException(status_code=500, detail="Error fetching order")
 
 
@@ -433,16 +809,18 @@ async def update_order_status(
     order_id: int,
     request: UpdateOrderStatusRequest,  # Accept body with "status"
     user: user_dependency,
-    db: db_dependency
+    db: async_db_dependency
 ):
     """
     Update the status of an order and set completed_at if status is DELIVERED
     """
     try:
         # require_admin(user)  # Only admins can update order status
-        order = db.query(models.Orders).filter(models.Orders.order_id == order_id).first()
+        order = (await db.execute(
+            select(models.Orders).where(models.Orders.order_id == order_id)
+        )).scalars().first()
         if not order:
-            logger.info(f"Order not found: ID {order_id}")
+            logger.info("Order not found: ID %s", order_id)
             raise HTTPException(status_code=404, detail="Order not found")
         
         # Update status from the request body
@@ -455,37 +833,54 @@ async def update_order_status(
             # Optionally clear completed_at if status changes away from DELIVERED
             order.completed_at = None
         
-        db.commit()
-        db.refresh(order)
+        await db.commit()
         
-        logger.info(f"Order {order_id} status updated to {request.status} by user {user.get('id')}")
+        logger.info("Order %s status updated to %s by user %s", order_id, request.status, user.get('id'))
         return {"message": f"Order status updated to {request.status}"}
     except SQLAlchemyError as e:
-        db.rollback()
-        logger.error(f"Error updating order status for order {order_id}: {str(e)}")
+        await db.rollback()
+        logger.error("Error updating order status for order %s: %s", order_id, e)
         raise HTTPException(status_code=500, detail="Error updating order status")
 
 
 @app.get("/dashboard", status_code=status.HTTP_200_OK)
-async def dashboard(user: user_dependency, db: db_dependency):
+async def dashboard(user: user_dependency, db: async_db_dependency):
     require_admin(user)
     try:
         id = user.get("id")
-        today = datetime.utcnow().date()
+        cache_key = cache.key(DASHBOARD_CACHE_NAMESPACE, id)
+        cached = await cache.get(cache_key)
+        if cached is not None:
+            return json_response(cached)
+
+        # Compare against a [midnight, next midnight) range rather than DATE(datetime) per row
+        today = datetime.combine(datetime.utcnow().date(), time.min)
+        tomorrow = today + timedelta(days=1)
         
-        total_sales = db.query(func.sum(models.Orders.total)).filter(models.Orders.user_id == id).scalar() or 0
-        total_products = db.query(func.count(models.Products.id)).filter(models.Products.user_id == id).scalar() or 0
-        today_sale = db.query(func.sum(models.Orders.total)).filter(
-            models.Orders.user_id == id, func.date(models.Orders.datetime) == today
-        ).scalar() or 0
+        # Both sales aggregates come back from a single round-trip; the product count comes from Redis
+        total_sales, today_sale = (await db.execute(
+            select(
+                func.coalesce(func.sum(models.Orders.total), 0),
+                func.coalesce(func.sum(case(
+                    (
+                        (models.Orders.datetime >= today) & (models.Orders.datetime < tomorrow),
+                        models.Orders.total,
+                    ),
+                    else_=0
+                )), 0),
+            ).where(models.Orders.user_id == id)
+        )).one()
+        total_products = await get_product_count(db, id)
         
-        return {
+        body = orjson.dumps({
             "total_sales": float(total_sales),
             "total_products": total_products,
             "today_sale": float(today_sale),
-        }
+        })
+        await cache.set(cache_key, body, DASHBOARD_CACHE_TTL)
+        return json_response(body)
     except SQLAlchemyError as e:
-        logger.error(f"Error fetching dashboard data: {str(e)}")
+        logger.error("Error fetching dashboard data: %s", e)
         raise HTTPException(status_code=500, detail="Error fetching dashboard data")
 
 
@@ -493,72 +888,78 @@ async def dashboard(user: user_dependency, db: db_dependency):
 
 # Create Address endpoint
 @app.post("/addresses", response_model=AddressResponse, status_code=status.HTTP_201_CREATED)
-async def create_address(user: user_dependency, db: db_dependency, address: AddressCreate):
+async def create_address(user: user_dependency, db: async_db_dependency, address: AddressCreate):
     try:
-        # If setting as default, unset other default addresses for this user
+        # If setting as default, unset other default addresses for this user. The reset and the
+        # insert share one transaction; on a first address the UPDATE is a zero-row index probe on
+        # (user_id, is_default), which is no dearer than an EXISTS check would be
         if address.is_default:
-            db.query(models.Address).filter(
-                models.Address.user_id == user.get("id"),
-                models.Address.is_default == True
-            ).update({"is_default": False})
+            await db.execute(
+                update(models.Address).where(
+                    models.Address.user_id == user.get("id"),
+                    models.Address.is_default == True
+                ).values(is_default=False)
+                .execution_options(synchronize_session=False)
+            )
         
         db_address = models.Address(
-            **address.dict(),
+            **address.model_dump(),
             user_id=user.get("id")
         )
         db.add(db_address)
-        db.commit()
-        db.refresh(db_address)
-        logger.info(f"Address created for user {user.get('id')}: Address ID {db_address.id}")
+        await db.commit()
+        logger.info("Address created for user %s: Address ID %s", user.get('id'), db_address.id)
         return db_address
     except SQLAlchemyError as e:
-        db.rollback()
-        logger.error(f"Error creating address: {str(e)}")
+        await db.rollback()
+        logger.error("Error creating address: %s", e)
         raise HTTPException(status_code=500, detail="Error creating address")
 
 # Get Addresses endpoint
 @app.get("/addresses", response_model=List[AddressResponse], status_code=status.HTTP_200_OK)
-async def get_addresses(user: user_dependency, db: db_dependency):
+async def get_addresses(user: user_dependency, db: async_db_dependency):
     try:
-        addresses = db.query(models.Address).filter(
-            models.Address.user_id == user.get("id")
-        ).all()
+        addresses = (await db.execute(
+            select(models.Address).where(models.Address.user_id == user.get("id"))
+        )).scalars().all()
         if not addresses:
-            logger.info(f"No addresses found for user {user.get('id')}")
+            logger.info("No addresses found for user %s", user.get('id'))
             return []
-        logger.info(f"Retrieved {len(addresses)} addresses for user {user.get('id')}")
+        logger.info("Retrieved %s addresses for user %s", len(addresses), user.get('id'))
         return addresses
     except SQLAlchemyError as e:
-        logger.error(f"Error fetching addresses: {str(e)}")
+        logger.error("Error fetching addresses: %s", e)
         raise HTTPException(status_code=500, detail="Error fetching addresses")
 
 
 @app.delete("/addresses/{address_id}", status_code=status.HTTP_200_OK)
-async def delete_address(address_id: int, user: user_dependency, db: db_dependency):
+async def delete_address(address_id: int, user: user_dependency, db: async_db_dependency):
     try:
-        address = db.query(models.Address).filter(
-            models.Address.id == address_id,
-            models.Address.user_id == user.get("id")
-        ).first()
+        address = (await db.execute(
+            select(models.Address).where(
+                models.Address.id == address_id,
+                models.Address.user_id == user.get("id")
+            )
+        )).scalars().first()
         if not address:
-            logger.info(f"Address not found: ID {address_id} for user {user.get('id')}")
+            logger.info("Address not found: ID %s for user %s", address_id, user.get('id'))
             raise HTTPException(status_code=404, detail="Address not found")
         
         # Check if address is used in any orders
-        order = db.query(models.Orders).filter(
-            models.Orders.address_id == address_id
-        ).first()
+        order = (await db.execute(
+            select(models.Orders).where(models.Orders.address_id == address_id)
+        )).scalars().first()
         if order:
-            logger.info(f"Cannot delete address {address_id}: used in order {order.order_id}")
+            logger.info("Cannot delete address %s: used in order %s", address_id, order.order_id)
             raise HTTPException(status_code=400, detail="Cannot delete address used in orders")
         
-        db.delete(address)
-        db.commit()
-        logger.info(f"Address {address_id} deleted by user {user.get('id')}")
+        await db.delete(address)
+        await db.commit()
+        logger.info("Address %s deleted by user %s", address_id, user.get('id'))
         return {"message": "Address deleted successfully"}
     except SQLAlchemyError as e:
-        db.rollback()
-        logger.error(f"Error deleting address {address_id}: {str(e)}")
+        await db.rollback()
+        logger.error("Error deleting address %s: %s", address_id, e)
         raise HTTPException(status_code=500, detail="Error deleting address")
 
 
@@ -568,7 +969,7 @@ async def delete_address(address_id: int, user: user_dependency, db: db_dependen
 @app.get("/admin/orders", response_model=PaginatedOrderWithUserResponse, status_code=status.HTTP_200_OK)
 async def fetch_all_orders(
     user: user_dependency,
-    db: db_dependency,
+    db: async_db_dependency,
     skip: int = Query(0, ge=0),
     limit: int = Query(10, ge=1, le=100),
     status: Optional[OrderStatus] = None
@@ -580,12 +981,12 @@ async def fetch_all_orders(
     """
     require_admin(user)
     try:
-        query = db.query(models.Orders).join(models.Users, models.Orders.user_id == models.Users.id)
+        query = select(models.Orders).join(models.Users, models.Orders.user_id == models.Users.id)
         if status:
-            query = query.filter(models.Orders.status == status)
+            query = query.where(models.Orders.status == status)
         
-        total = query.count()
-        orders = (
+        total = await db.scalar(select(func.count()).select_from(query.subquery()))
+        orders = (await db.execute(
             query
             .options(
                 joinedload(models.Orders.address),
@@ -593,13 +994,12 @@ async def fetch_all_orders(
             )
             .offset(skip)
             .limit(limit)
-            .all()
-        )
+        )).scalars().all()
 
         page = (skip // limit) + 1
         pages = ceil(total / limit) if limit > 0 else 0
 
-        logger.info(f"Admin {user.get('id')} fetched {len(orders)} orders (page {page}, limit {limit})")
+        logger.info("Admin %s fetched %s orders (page %s, limit %s)", user.get('id'), len(orders), page, limit)
         return {
             "items": orders,
             "total": total,
@@ -608,7 +1008,7 @@ async def fetch_all_orders(
             "pages": pages
         }
     except SQLAlchemyError as e:
-        logger.error(f"Error fetching all orders: {str(e)}")
+        logger.error("Error fetching all orders: %s", e)
         raise HTTPException(status_code=500, detail="Error fetching orders")
         
                 
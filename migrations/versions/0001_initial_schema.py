@@ -0,0 +1,158 @@
+"""initial schema
+
+Tables and indexes exactly as Base.metadata.create_all created them at startup, before
+any of the later index work (those indexes live in follow-up revisions). Databases that
+were created that way should be marked current with `alembic stamp 0001`, then upgraded.
+
+Revision ID: 0001
+Revises: 
+Create Date: 2026-10-14 19:01:14.334377
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import mysql
+
+# revision identifiers, used by Alembic.
+revision: str = '0001'
+down_revision: Union[str, Sequence[str], None] = None
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('categories',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('name', sa.String(length=50), nullable=False),
+    sa.Column('description', sa.String(length=200), nullable=True),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('name')
+    )
+    op.create_index(op.f('ix_categories_id'), 'categories', ['id'], unique=False)
+    op.create_table('users',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('username', sa.String(length=50), nullable=True),
+    sa.Column('email', sa.String(length=200), nullable=True),
+    sa.Column('hashed_password', sa.String(length=256), nullable=True),
+    sa.Column('role', sa.Enum('ADMIN', 'CUSTOMER', name='role'), nullable=False),
+    sa.Column('created_at', sa.DateTime(), nullable=True),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_users_email'), 'users', ['email'], unique=True)
+    op.create_index(op.f('ix_users_id'), 'users', ['id'], unique=False)
+    op.create_index(op.f('ix_users_username'), 'users', ['username'], unique=True)
+    op.create_table('addresses',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('first_name', sa.String(length=100), nullable=False),
+    sa.Column('last_name', sa.String(length=100), nullable=False),
+    sa.Column('phone_number', sa.String(length=20), nullable=False),
+    sa.Column('address', sa.String(length=100), nullable=False),
+    sa.Column('additional_info', sa.String(length=255), nullable=True),
+    sa.Column('region', sa.String(length=100), nullable=True),
+    sa.Column('city', sa.String(length=100), nullable=False),
+    sa.Column('is_default', sa.Boolean(), nullable=False),
+    sa.Column('user_id', sa.Integer(), nullable=True),
+    sa.Column('created_at', sa.DateTime(), nullable=True),
+    sa.ForeignKeyConstraint(['user_id'], ['users.id'], ),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_addresses_id'), 'addresses', ['id'], unique=False)
+    op.create_table('products',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('name', sa.String(length=100), nullable=False),
+    sa.Column('cost', sa.Numeric(precision=14, scale=2), nullable=False),
+    sa.Column('price', sa.Numeric(precision=14, scale=2), nullable=False),
+    sa.Column('img_url', sa.String(length=200), nullable=True),
+    sa.Column('stock_quantity', sa.Numeric(precision=14, scale=2), nullable=False),
+    sa.Column('description', sa.String(length=200), nullable=True),
+    sa.Column('created_at', sa.DateTime(), nullable=True),
+    sa.Column('barcode', sa.Numeric(precision=12), nullable=True),
+    sa.Column('user_id', sa.Integer(), nullable=True),
+    sa.Column('category_id', sa.Integer(), nullable=True),
+    sa.Column('brand', sa.String(length=100), nullable=True),
+    sa.ForeignKeyConstraint(['category_id'], ['categories.id'], ),
+    sa.ForeignKeyConstraint(['user_id'], ['users.id'], ),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('barcode')
+    )
+    op.create_index(op.f('ix_products_id'), 'products', ['id'], unique=False)
+    op.create_index(op.f('ix_products_name'), 'products', ['name'], unique=True)
+    op.create_table('orders',
+    sa.Column('order_id', sa.Integer(), nullable=False),
+    sa.Column('total', sa.Numeric(precision=14, scale=2), nullable=True),
+    sa.Column('datetime', sa.DateTime(), nullable=True),
+    sa.Column('status', sa.Enum('PENDING', 'DELIVERED', 'CANCELLED', 'PROCESSING', name='orderstatus'), nullable=False),
+    sa.Column('user_id', sa.Integer(), nullable=True),
+    sa.Column('address_id', sa.Integer(), nullable=True),
+    sa.Column('delivery_fee', sa.Numeric(precision=14, scale=2), nullable=False),
+    sa.Column('completed_at', sa.DateTime(), nullable=True),
+    sa.ForeignKeyConstraint(['address_id'], ['addresses.id'], ),
+    sa.ForeignKeyConstraint(['user_id'], ['users.id'], ),
+    sa.PrimaryKeyConstraint('order_id')
+    )
+    op.create_index(op.f('ix_orders_datetime'), 'orders', ['datetime'], unique=False)
+    op.create_index(op.f('ix_orders_order_id'), 'orders', ['order_id'], unique=False)
+    op.create_table('order_details',
+    sa.Column('order_detail_id', sa.Integer(), nullable=False),
+    sa.Column('order_id', sa.Integer(), nullable=True),
+    sa.Column('product_id', sa.Integer(), nullable=True),
+    sa.Column('quantity', sa.Numeric(precision=15, scale=2), nullable=True),
+    sa.Column('total_price', sa.Numeric(precision=15, scale=2), nullable=True),
+    sa.ForeignKeyConstraint(['order_id'], ['orders.order_id'], ),
+    sa.ForeignKeyConstraint(['product_id'], ['products.id'], ),
+    sa.PrimaryKeyConstraint('order_detail_id')
+    )
+    op.create_table('transactions',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('_pid', sa.Integer(), nullable=False),
+    sa.Column('party_a', sa.String(length=100), nullable=False),
+    sa.Column('party_b', sa.String(length=100), nullable=False),
+    sa.Column('account_reference', sa.String(length=150), nullable=False),
+    sa.Column('transaction_category', sa.Integer(), nullable=False),
+    sa.Column('transaction_type', sa.Integer(), nullable=False),
+    sa.Column('transaction_channel', sa.Integer(), nullable=False),
+    sa.Column('transaction_aggregator', sa.Integer(), nullable=False),
+    sa.Column('transaction_id', sa.String(length=100), nullable=True),
+    sa.Column('transaction_amount', sa.Numeric(precision=10, scale=2), nullable=False),
+    sa.Column('transaction_code', sa.String(length=100), nullable=True),
+    sa.Column('transaction_timestamp', sa.DateTime(), nullable=True),
+    sa.Column('transaction_details', sa.Text(), nullable=False),
+    sa.Column('_feedback', mysql.JSON(), nullable=False),
+    sa.Column('_status', sa.Enum('PENDING', 'PROCESSING', 'PROCESSED', 'REJECTED', 'ACCEPTED', name='transactionstatus'), nullable=True),
+    sa.Column('created_at', sa.DateTime(), nullable=True),
+    sa.Column('updated_at', sa.DateTime(), nullable=True),
+    sa.Column('user_id', sa.Integer(), nullable=True),
+    sa.ForeignKeyConstraint(['_pid'], ['orders.order_id'], ),
+    sa.ForeignKeyConstraint(['user_id'], ['users.id'], ),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('transaction_code')
+    )
+    op.create_index(op.f('ix_transactions__pid'), 'transactions', ['_pid'], unique=False)
+    op.create_index(op.f('ix_transactions_id'), 'transactions', ['id'], unique=False)
+    op.create_index(op.f('ix_transactions_transaction_id'), 'transactions', ['transaction_id'], unique=True)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f('ix_transactions_transaction_id'), table_name='transactions')
+    op.drop_index(op.f('ix_transactions_id'), table_name='transactions')
+    op.drop_index(op.f('ix_transactions__pid'), table_name='transactions')
+    op.drop_table('transactions')
+    op.drop_table('order_details')
+    op.drop_index(op.f('ix_orders_order_id'), table_name='orders')
+    op.drop_index(op.f('ix_orders_datetime'), table_name='orders')
+    op.drop_table('orders')
+    op.drop_index(op.f('ix_products_name'), table_name='products')
+    op.drop_index(op.f('ix_products_id'), table_name='products')
+    op.drop_table('products')
+    op.drop_index(op.f('ix_addresses_id'), table_name='addresses')
+    op.drop_table('addresses')
+    op.drop_index(op.f('ix_users_username'), table_name='users')
+    op.drop_index(op.f('ix_users_id'), table_name='users')
+    op.drop_index(op.f('ix_users_email'), table_name='users')
+    op.drop_table('users')
+    op.drop_index(op.f('ix_categories_id'), table_name='categories')
+    op.drop_table('categories')
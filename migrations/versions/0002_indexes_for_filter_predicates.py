@@ -0,0 +1,37 @@
+"""indexes for filter predicates
+
+order_details.product_id is probed before a product can be deleted, and addresses are
+listed and reset by (user_id, is_default). MySQL has no partial indexes, so the
+default-address lookup uses a plain composite index.
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-14 19:03:08.793319
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0002'
+down_revision: Union[str, Sequence[str], None] = '0001'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index('ix_addresses_user_id_is_default', 'addresses', ['user_id', 'is_default'], unique=False)
+    op.create_index(op.f('ix_order_details_product_id'), 'order_details', ['product_id'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    # InnoDB dropped its implicit foreign key indexes when these were added; put those back first
+    op.create_index('product_id', 'order_details', ['product_id'], unique=False)
+    op.create_index('user_id', 'addresses', ['user_id'], unique=False)
+    op.drop_index(op.f('ix_order_details_product_id'), table_name='order_details')
+    op.drop_index('ix_addresses_user_id_is_default', table_name='addresses')
@@ -0,0 +1,33 @@
+"""products name fulltext index
+
+Product search keeps its '%search%' substring semantics but narrows rows with MATCH ...
+AGAINST first; a leading-wildcard LIKE cannot use the existing btree index on name. The
+ngram parser indexes every ngram_token_size-character run, so matches inside words
+("phone" in "iPhone") are found, unlike the default word parser.
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2026-10-14 19:05:41.208114
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0003'
+down_revision: Union[str, Sequence[str], None] = '0002'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index('ix_products_name_fulltext', 'products', ['name'], unique=False, mysql_prefix='FULLTEXT', mysql_with_parser='ngram')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_products_name_fulltext', table_name='products')
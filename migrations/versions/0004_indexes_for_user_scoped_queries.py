@@ -0,0 +1,49 @@
+"""indexes for user-scoped queries
+
+Indexes added to the models alongside the query work that were left out of the 0001
+baseline, because create_all never added indexes to tables that already existed:
+transactions.user_id, the (created_at, id) and (user_id, created_at, id) seeks used by
+cursor pagination, order_details.order_id for loading order lines, and
+orders(user_id, datetime) for order history and the dashboard. products.user_id and
+orders.user_id get no index of their own; the composites leading with user_id cover their
+lookups and foreign keys.
+
+Revision ID: 0004
+Revises: 0003
+Create Date: 2026-10-14 19:20:05.114870
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0004'
+down_revision: Union[str, Sequence[str], None] = '0003'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index('ix_products_created_at_id', 'products', ['created_at', 'id'], unique=False)
+    op.create_index('ix_products_user_id_created_at_id', 'products', ['user_id', 'created_at', 'id'], unique=False)
+    op.create_index('ix_orders_user_id_datetime', 'orders', ['user_id', 'datetime'], unique=False)
+    op.create_index(op.f('ix_order_details_order_id'), 'order_details', ['order_id'], unique=False)
+    op.create_index(op.f('ix_transactions_user_id'), 'transactions', ['user_id'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    # InnoDB dropped its implicit foreign key indexes when these were added; put those back first
+    op.create_index('user_id', 'products', ['user_id'], unique=False)
+    op.create_index('user_id', 'orders', ['user_id'], unique=False)
+    op.create_index('order_id', 'order_details', ['order_id'], unique=False)
+    op.create_index('user_id', 'transactions', ['user_id'], unique=False)
+    op.drop_index(op.f('ix_transactions_user_id'), table_name='transactions')
+    op.drop_index(op.f('ix_order_details_order_id'), table_name='order_details')
+    op.drop_index('ix_orders_user_id_datetime', table_name='orders')
+    op.drop_index('ix_products_user_id_created_at_id', table_name='products')
+    op.drop_index('ix_products_created_at_id', table_name='products')
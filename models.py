@@ -1,10 +1,15 @@
-from sqlalchemy import Column, Integer, String, func, DateTime, Numeric, ForeignKey, Enum, Boolean, Text
+from sqlalchemy import Column, Integer, String, func, DateTime, Numeric, ForeignKey, Enum, Boolean, Text, Index
 from database import Base
 from sqlalchemy.orm import relationship
 import enum
 from datetime import datetime
 from sqlalchemy.dialects.mysql import JSON
 
+def now_seconds() -> datetime:
+    """Current time truncated to whole seconds, matching what a DATETIME (fsp 0) column stores"""
+    return datetime.now().replace(microsecond=0)
+
+
 class TransactionStatus(enum.Enum):
     PENDING = 0
     PROCESSING = 1
@@ -51,7 +56,7 @@ class Products(Base):
     img_url = Column(String(200), nullable=True)
     stock_quantity = Column(Numeric(precision=14, scale=2), nullable=False)
     description = Column(String(200), nullable=True)  # New description field
-    created_at = Column(DateTime, default=func.now())
+    created_at = Column(DateTime, default=now_seconds)  # set client-side so the new row needs no reload
     barcode = Column(Numeric(precision=12), unique=True)
     user_id = Column(Integer, ForeignKey('users.id'))
     category_id = Column(Integer, ForeignKey('categories.id'))
@@ -60,6 +65,14 @@ class Products(Base):
     category = relationship("Categories", back_populates="products")
     order_details = relationship("OrderDetails", back_populates="product")
 
+    # Back the (created_at DESC, id DESC) seek used by cursor pagination
+    __table_args__ = (
+        Index("ix_products_created_at_id", "created_at", "id"),
+        Index("ix_products_user_id_created_at_id", "user_id", "created_at", "id"),
+        # Substring search on product names (MATCH ... AGAINST in main.py)
+        Index("ix_products_name_fulltext", "name", mysql_prefix="FULLTEXT", mysql_with_parser="ngram"),
+    )
+
 class Orders(Base):
     __tablename__ = "orders"
     order_id = Column(Integer, primary_key=True, index=True)
@@ -75,12 +88,17 @@ class Orders(Base):
     address = relationship("Address")
     transactions = relationship("Transaction", back_populates="order")
 
+    # Per-user order history and dashboard sales filter on user_id then scan by datetime
+    __table_args__ = (
+        Index("ix_orders_user_id_datetime", "user_id", "datetime"),
+    )
+
 
 class OrderDetails(Base):
     __tablename__ = "order_details"
     order_detail_id = Column(Integer, primary_key=True)
-    order_id = Column(Integer, ForeignKey("orders.order_id"))
-    product_id = Column(Integer, ForeignKey("products.id"))
+    order_id = Column(Integer, ForeignKey("orders.order_id"), index=True)
+    product_id = Column(Integer, ForeignKey("products.id"), index=True)
     quantity = Column(Numeric(precision=15, scale=2))
     total_price = Column(Numeric(precision=15, scale=2))
     product = relationship("Products", back_populates="order_details")
@@ -98,11 +116,16 @@ class Address(Base):
     city = Column(String(100), nullable=False)
     is_default = Column(Boolean, default=False, nullable=False)
     user_id = Column(Integer, ForeignKey('users.id'))
-    created_at = Column(DateTime, default=func.now())
+    created_at = Column(DateTime, default=now_seconds)  # set client-side so the new row needs no reload
     
     user = relationship("Users", back_populates="addresses")
     orders = relationship("Orders", back_populates="address") 
 
+    # Address lists and the default-address reset both filter on user_id, is_default
+    __table_args__ = (
+        Index("ix_addresses_user_id_is_default", "user_id", "is_default"),
+    )
+
 class Transaction(Base):
     __tablename__ = 'transactions'
     
@@ -124,7 +147,7 @@ class Transaction(Base):
     _status = Column(Enum(TransactionStatus), default=TransactionStatus.PENDING)
     created_at = Column(DateTime, default=datetime.utcnow)
     updated_at = Column(DateTime, onupdate=func.now())
-    user_id = Column(Integer, ForeignKey('users.id'))
+    user_id = Column(Integer, ForeignKey('users.id'), index=True)
     
     user = relationship("Users", back_populates="transactions")
     order = relationship("Orders", back_populates="transactions")
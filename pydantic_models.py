@@ -107,10 +107,16 @@ class UpdateProduct(BaseModel):
 
 class PaginatedProductResponse(BaseModel):
     items: List[ProductResponse]
-    total: int
+    # Only filled in when the client asks for include_total
+    total: Optional[int] = None
     page: int
     limit: int
-    pages: int
+    pages: Optional[int] = None
+
+class CursorPaginatedProductResponse(BaseModel):
+    items: List[ProductResponse]
+    next_cursor: Optional[str] = None
+    limit: int
 
 class ImageResponse(BaseModel):
     message: str
@@ -161,6 +167,10 @@ class PaginatedOrderResponse(BaseModel):
     pages: int
 
 
+class CursorPaginatedOrderResponse(BaseModel):
+    items: List[OrderResponse]
+    next_cursor: Optional[str] = None
+    limit: int
 
 
 # Pydantic model for user details in the response